@@ -1,13 +1,68 @@
 import sqlite3
+import threading
 from pathlib import Path
 
 from .settings import Settings
 
 
+_connections: dict[tuple[str, int], sqlite3.Connection] = {}
+_connections_lock = threading.Lock()
+
+
 def connect(db_path: str | Path):
-    conn = sqlite3.connect(str(db_path))
+    """Return a cached connection for this (db_path, thread) pair.
+
+    Connections are long-lived so SQLite keeps its page cache warm across
+    requests; keying by thread avoids sharing one connection between the
+    server's worker threads.
+    """
+    key = (str(db_path), threading.get_ident())
+    with _connections_lock:
+        conn = _connections.get(key)
+        if conn is None:
+            conn = _new_connection(db_path)
+            _connections[key] = conn
+    return conn
+
+
+def close_connections(db_path: str | Path | None = None) -> None:
+    """Close cached connections, for all databases or just one path."""
+    path = None if db_path is None else str(db_path)
+    with _connections_lock:
+        keys = [key for key in _connections if path is None or key[0] == path]
+        for key in keys:
+            _connections.pop(key).close()
+    # Cached reads must not outlive the database they came from (':memory:'
+    # databases vanish with their connection). Imported here to avoid a
+    # cycle: repo imports this module at load time.
+    from .repo import _invalidate_read_caches
+
+    _invalidate_read_caches(db_path)
+
+
+def _new_connection(db_path: str | Path) -> sqlite3.Connection:
+    path = str(db_path)
+    # uri=True lets tests point at "file:...?mode=memory&cache=shared" style
+    # databases; plain paths and ":memory:" behave exactly as before.
+    # check_same_thread=False because the registry already hands each thread
+    # its own connection, while close_connections must be able to sweep
+    # entries cached by other threads (sqlite3 here is serialized).
+    conn = sqlite3.connect(
+        path,
+        cached_statements=256,
+        check_same_thread=False,
+        uri=path.startswith("file:"),
+    )
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA foreign_keys = ON;")
+    # journal_mode persists in the database file; the rest are per-connection.
+    conn.execute("PRAGMA journal_mode = WAL;")
+    conn.execute("PRAGMA wal_autocheckpoint = 1000;")
+    conn.execute("PRAGMA synchronous = NORMAL;")
+    conn.execute("PRAGMA temp_store = MEMORY;")
+    conn.execute("PRAGMA cache_size = -64000;")
+    conn.execute("PRAGMA mmap_size = 268435456;")
+    conn.execute("PRAGMA busy_timeout = 5000;")
     return conn
 
 
@@ -277,9 +332,21 @@ def _rebuild_transactions_table(conn: sqlite3.Connection) -> None:
     conn.execute("DROP TABLE transactions__legacy")
 
 
+# Bump when init_db's schema/migration work changes; databases already at
+# this version skip the table_info probes and rebuild checks entirely.
+_SCHEMA_VERSION = 2
+
+
 def init_db(settings: Settings) -> None:
     settings.data_dir.mkdir(parents=True, exist_ok=True)
     with connect(settings.db_path) as conn:
+        user_version = int(conn.execute("PRAGMA user_version").fetchone()[0])
+        if user_version >= _SCHEMA_VERSION:
+            return
+        # DDL runs in autocommit mode by default, so every CREATE/ALTER below
+        # would otherwise pay its own WAL fsync; batch the migration into one
+        # explicit transaction instead.
+        conn.execute("BEGIN IMMEDIATE")
         _create_accounts_table(conn)
         if not _column_exists(conn, "accounts", "archived"):
             conn.execute(
@@ -360,6 +427,7 @@ def init_db(settings: Settings) -> None:
 
             conn.commit()
             conn.execute("PRAGMA foreign_keys = ON;")
+            conn.execute("BEGIN IMMEDIATE")
 
         conn.execute(
             """
@@ -387,6 +455,21 @@ def init_db(settings: Settings) -> None:
             ON transactions(account_id, date DESC, id DESC)
             """
         )
+        # Covers both halves of the summary query (totals and the expense
+        # category breakdown) so neither touches the table.
+        conn.execute("DROP INDEX IF EXISTS idx_transactions_date_direction")
+        conn.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_transactions_date_direction_category
+            ON transactions(date, direction, category, amount_cents)
+            """
+        )
+        conn.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_transactions_date_id
+            ON transactions(date DESC, id DESC)
+            """
+        )
         conn.execute(
             """
             CREATE INDEX IF NOT EXISTS idx_transactions_import_batch_id
@@ -412,3 +495,7 @@ def init_db(settings: Settings) -> None:
             """
         )
         conn.execute("DROP INDEX IF EXISTS idx_transactions_source_txn_id_unique")
+        # Refresh sqlite_stat1 so the planner prefers the indexes above from
+        # the first query instead of guessing costs.
+        conn.execute("ANALYZE")
+        conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
@@ -1,8 +1,13 @@
+import re
 from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
 
 
+_AMOUNT_RE = re.compile(r"^\s*(\d+)(?:\.(\d{1,2}))?\s*$")
+_VALID_DIRECTIONS = frozenset(("income", "expense"))
+
+
 def validate_direction(s: str) -> str:
-    if s not in {"income", "expense"}:
+    if s not in _VALID_DIRECTIONS:
         raise ValueError("direction must be income or expense")
     return s
 
@@ -10,6 +15,12 @@ def validate_direction(s: str) -> str:
 def parse_amount_to_cents(s: str) -> int:
     if not isinstance(s, str) or not s.strip():
         raise ValueError("amount required")
+    # Fast path for plain "123" / "123.45" inputs; Decimal below keeps the
+    # exact error semantics for everything else (negatives, exponents, junk).
+    match = _AMOUNT_RE.match(s)
+    if match is not None:
+        whole, fraction = match.groups()
+        return int(whole) * 100 + int((fraction or "").ljust(2, "0"))
     try:
         d = Decimal(s)
     except InvalidOperation as e:
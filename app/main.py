@@ -1,3 +1,5 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 
@@ -7,9 +9,18 @@ from .settings import get_settings
 
 
 settings = get_settings()
-init_db(settings)
 
-app = FastAPI()
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    # Deferring init_db to startup keeps plain imports (test collection,
+    # tooling) from opening the database; it reads the settings attribute so
+    # tests that swap it in before starting the app get their own path.
+    init_db(settings)
+    yield
+
+
+app = FastAPI(lifespan=_lifespan)
 app.mount("/static", StaticFiles(directory="static"), name="static")
 app.include_router(ledger.router)
 app.include_router(review.router)
@@ -1,8 +1,10 @@
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Transaction:
+    """One ledger row; field order mirrors the list_txns projection."""
+
     id: int
     account_id: int
     date: str
@@ -10,5 +12,4 @@ class Transaction:
     amount_cents: int
     category: str
     note: str
-    created_at: str
-    updated_at: str
+    import_batch_id: str | None
@@ -1,10 +1,151 @@
 import sqlite3
+import time
+from collections import namedtuple
+from contextlib import contextmanager
 from uuid import uuid4
 
 from .db import connect
+from .models import Transaction
+
+
+# Hot-path SQL lives in module constants so repeated calls hand sqlite3's
+# prepared-statement cache the same interned string every time.
+_SQL_SELECT_TXNS = """
+    SELECT id, account_id, date, direction, amount_cents, category, note, import_batch_id
+    FROM transactions
+    WHERE date >= ? AND date <= ?
+    ORDER BY date DESC, id DESC
+    LIMIT ?
+"""
+
+_SQL_SELECT_EXPORT_ROWS = """
+    SELECT
+      id,
+      account_id,
+      date,
+      direction,
+      printf('%d.%02d', amount_cents / 100, amount_cents % 100) AS amount,
+      category,
+      note
+    FROM transactions
+    WHERE date >= ? AND date <= ?
+    ORDER BY date DESC, id DESC
+"""
+
+_SQL_SELECT_CATEGORIES = """
+    SELECT DISTINCT category
+    FROM transactions
+    WHERE TRIM(category) <> ''
+    ORDER BY category ASC
+"""
+
+# One statement for both summary shapes: the CTE scans the date range once
+# and the 'total' / 'category' rows are split apart again in _summarize.
+_SQL_SUMMARY = """
+    WITH filtered AS (
+      SELECT direction, category, amount_cents
+      FROM transactions
+      WHERE date >= ? AND date <= ?
+    )
+    SELECT 'total' AS kind, direction AS name, SUM(amount_cents) AS amount_cents
+    FROM filtered
+    GROUP BY direction
+    UNION ALL
+    SELECT 'category', category, SUM(amount_cents)
+    FROM filtered
+    WHERE direction = 'expense'
+    GROUP BY category
+    ORDER BY kind DESC, amount_cents DESC, name ASC
+"""
+
+_SQL_INSERT_TXN = """
+    INSERT INTO transactions(
+      account_id,
+      date,
+      direction,
+      amount_cents,
+      category,
+      note,
+      source_txn_id,
+      import_batch_id
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# RETURNING (SQLite 3.35+) hands the new id back in the same round-trip;
+# create_txns_bulk keeps the plain form because executemany cannot RETURNING.
+_SQL_INSERT_TXN_RETURNING = _SQL_INSERT_TXN + "    RETURNING id\n"
+
+_SQL_SELECT_ACCOUNT_STATE = "SELECT id, archived FROM accounts WHERE id = ?"
+
+_SQL_SELECT_TXN = """
+    SELECT * FROM transactions
+    WHERE id = ?
+"""
+
+_SQL_UPDATE_TXN = """
+    UPDATE transactions
+    SET
+      date = ?,
+      direction = ?,
+      amount_cents = ?,
+      category = ?,
+      note = ?,
+      updated_at = datetime('now')
+    WHERE id = ?
+"""
+
+
+CategoryTotal = namedtuple("CategoryTotal", ("category", "amount_cents"))
+
+_READ_CACHE_TTL_SECONDS = 30.0
+_READ_CACHE_MAX_ENTRIES = 256
+
+# (db_path, start, end) -> (stored_at, summary dict)
+_summary_cache: dict[tuple[str, str, str], tuple[float, dict]] = {}
+# (db_path, include_archived) -> (stored_at, account rows)
+_accounts_cache: dict[tuple[str, bool], tuple[float, list]] = {}
+
+
+def _cache_get(cache: dict, key):
+    entry = cache.get(key)
+    if entry is None:
+        return None
+    if time.monotonic() - entry[0] > _READ_CACHE_TTL_SECONDS:
+        cache.pop(key, None)
+        return None
+    return entry[1]
+
+
+def _cache_put(cache: dict, key, value):
+    now = time.monotonic()
+    # Keys include request-supplied date ranges, so sweep expired entries and
+    # cap the size to keep abandoned keys from accumulating without bound.
+    for stale in [
+        key
+        for key, (stored_at, _) in cache.items()
+        if now - stored_at > _READ_CACHE_TTL_SECONDS
+    ]:
+        cache.pop(stale, None)
+    if len(cache) >= _READ_CACHE_MAX_ENTRIES:
+        oldest = min(cache, key=lambda entry_key: cache[entry_key][0])
+        cache.pop(oldest, None)
+    cache[key] = (now, value)
+    return value
+
+
+def _invalidate_read_caches(db_path=None) -> None:
+    path = None if db_path is None else str(db_path)
+    for cache in (_summary_cache, _accounts_cache):
+        for key in [key for key in cache if path is None or key[0] == path]:
+            cache.pop(key, None)
 
 
 def list_accounts(db_path, *, include_archived: bool = False):
+    cache_key = (str(db_path), include_archived)
+    cached = _cache_get(_accounts_cache, cache_key)
+    if cached is not None:
+        return cached
     with connect(db_path) as conn:
         if include_archived:
             cur = conn.execute(
@@ -23,7 +164,7 @@ def list_accounts(db_path, *, include_archived: bool = False):
                 ORDER BY id ASC
                 """
             )
-        return cur.fetchall()
+        return _cache_put(_accounts_cache, cache_key, cur.fetchall())
 
 
 def get_account(db_path, account_id: int):
@@ -53,7 +194,9 @@ def create_account(db_path, name: str) -> int:
             )
         except sqlite3.IntegrityError as exc:
             raise ValueError("account name already exists") from exc
-        return int(cur.lastrowid)
+        account_id = int(cur.lastrowid)
+    _invalidate_read_caches(db_path)
+    return account_id
 
 
 def rename_account(db_path, account_id: int, name: str) -> None:
@@ -61,86 +204,94 @@ def rename_account(db_path, account_id: int, name: str) -> None:
     if not account_name:
         raise ValueError("account name required")
     with connect(db_path) as conn:
-        account = conn.execute(
-            "SELECT id, archived FROM accounts WHERE id = ?",
-            (account_id,),
-        ).fetchone()
-        if account is None:
-            raise ValueError("account not found")
-        if int(account["archived"]) == 1:
-            raise ValueError("archived account is read-only")
+        conn.execute("BEGIN IMMEDIATE")
         try:
             cur = conn.execute(
                 """
                 UPDATE accounts
                 SET name = ?
-                WHERE id = ?
+                WHERE id = ? AND archived = 0
                 """,
                 (account_name, account_id),
             )
         except sqlite3.IntegrityError as exc:
             raise ValueError("account name already exists") from exc
         if cur.rowcount == 0:
-            raise ValueError("account not found")
+            # Only the failure path needs the extra SELECT to tell a missing
+            # account apart from an archived one.
+            account = conn.execute(
+                _SQL_SELECT_ACCOUNT_STATE,
+                (account_id,),
+            ).fetchone()
+            if account is None:
+                raise ValueError("account not found")
+            raise ValueError("archived account is read-only")
+    _invalidate_read_caches(db_path)
 
 
 def delete_account(db_path, account_id: int) -> None:
     if account_id == 1:
         raise ValueError("default account cannot be deleted")
     with connect(db_path) as conn:
+        conn.execute("BEGIN IMMEDIATE")
         account = conn.execute(
-            "SELECT id, archived FROM accounts WHERE id = ?",
+            """
+            SELECT
+              a.id,
+              a.archived,
+              (SELECT COUNT(*) FROM transactions WHERE account_id = a.id) AS txn_count
+            FROM accounts AS a
+            WHERE a.id = ?
+            """,
             (account_id,),
         ).fetchone()
         if account is None:
             raise ValueError("account not found")
         if int(account["archived"]) == 1:
             raise ValueError("archived account is read-only")
-
-        txn_count = conn.execute(
-            "SELECT COUNT(*) AS c FROM transactions WHERE account_id = ?",
-            (account_id,),
-        ).fetchone()["c"]
-        if int(txn_count) > 0:
+        if int(account["txn_count"]) > 0:
             raise ValueError("account has transactions")
 
         conn.execute("DELETE FROM accounts WHERE id = ?", (account_id,))
+    _invalidate_read_caches(db_path)
 
 
 def archive_account(db_path, account_id: int) -> None:
     if account_id == 1:
         raise ValueError("default account cannot be archived")
     with connect(db_path) as conn:
-        account = conn.execute(
-            "SELECT id, archived FROM accounts WHERE id = ?",
-            (account_id,),
-        ).fetchone()
-        if account is None:
-            raise ValueError("account not found")
-        if int(account["archived"]) == 1:
-            raise ValueError("account already archived")
-
-        conn.execute(
-            "UPDATE accounts SET archived = 1 WHERE id = ?",
+        conn.execute("BEGIN IMMEDIATE")
+        cur = conn.execute(
+            "UPDATE accounts SET archived = 1 WHERE id = ? AND archived = 0",
             (account_id,),
         )
+        if cur.rowcount == 0:
+            account = conn.execute(
+                _SQL_SELECT_ACCOUNT_STATE,
+                (account_id,),
+            ).fetchone()
+            if account is None:
+                raise ValueError("account not found")
+            raise ValueError("account already archived")
+    _invalidate_read_caches(db_path)
 
 
 def restore_account(db_path, account_id: int) -> None:
     with connect(db_path) as conn:
-        account = conn.execute(
-            "SELECT id, archived FROM accounts WHERE id = ?",
-            (account_id,),
-        ).fetchone()
-        if account is None:
-            raise ValueError("account not found")
-        if int(account["archived"]) == 0:
-            raise ValueError("account is not archived")
-
-        conn.execute(
-            "UPDATE accounts SET archived = 0 WHERE id = ?",
+        conn.execute("BEGIN IMMEDIATE")
+        cur = conn.execute(
+            "UPDATE accounts SET archived = 0 WHERE id = ? AND archived = 1",
             (account_id,),
         )
+        if cur.rowcount == 0:
+            account = conn.execute(
+                _SQL_SELECT_ACCOUNT_STATE,
+                (account_id,),
+            ).fetchone()
+            if account is None:
+                raise ValueError("account not found")
+            raise ValueError("account is not archived")
+    _invalidate_read_caches(db_path)
 
 
 def create_txn(
@@ -151,26 +302,14 @@ def create_txn(
     direction,
     amount_cents,
     category,
-    note,
+    note="",
     source_txn_id: str | None = None,
     import_batch_id: str | None = None,
 ) -> int:
     _ = account_id
     with connect(db_path) as conn:
         cur = conn.execute(
-            """
-            INSERT INTO transactions(
-              account_id,
-              date,
-              direction,
-              amount_cents,
-              category,
-              note,
-              source_txn_id,
-              import_batch_id
-            )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+            _SQL_INSERT_TXN_RETURNING,
             (
                 1,
                 date_str,
@@ -182,7 +321,78 @@ def create_txn(
                 import_batch_id,
             ),
         )
-        return int(cur.lastrowid)
+        txn_id = int(cur.fetchone()["id"])
+    _invalidate_read_caches(db_path)
+    return txn_id
+
+
+# 100 rows x 8 columns per statement stays well under SQLite's default
+# bound-parameter limit of 999.
+_BULK_INSERT_CHUNK_ROWS = 100
+
+
+def create_txns_bulk(db_path, rows: list[dict]) -> int:
+    """Insert many transactions with multi-row statements in one transaction.
+
+    Each row takes the same keys as the create_txn keyword arguments;
+    batching keeps the whole insert to a single commit/fsync, and packing
+    up to _BULK_INSERT_CHUNK_ROWS value tuples per statement cuts the
+    Python<->SQLite round-trips.
+    """
+    txn_rows = [
+        (
+            1,
+            row["date_str"],
+            row["direction"],
+            row["amount_cents"],
+            row["category"],
+            row.get("note", ""),
+            row.get("source_txn_id"),
+            row.get("import_batch_id"),
+        )
+        for row in rows
+    ]
+    if not txn_rows:
+        return 0
+
+    insert_head, values_sql = _SQL_INSERT_TXN.rsplit("VALUES", 1)
+    values_sql = values_sql.strip()
+    with connect(db_path) as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        for offset in range(0, len(txn_rows), _BULK_INSERT_CHUNK_ROWS):
+            chunk = txn_rows[offset : offset + _BULK_INSERT_CHUNK_ROWS]
+            sql = insert_head + "VALUES " + ", ".join([values_sql] * len(chunk))
+            params = [value for row in chunk for value in row]
+            conn.execute(sql, params)
+    _invalidate_read_caches(db_path)
+    return len(txn_rows)
+
+
+@contextmanager
+def with_deferred_indexes(db_path):
+    """Drop the transactions indexes around a bulk load and rebuild after.
+
+    Rebuilding once after N inserts is a single sort instead of N B-tree
+    updates per index. The definitions are read from sqlite_master so the
+    rebuild always matches the current schema.
+    """
+    conn = connect(db_path)
+    indexes = conn.execute(
+        """
+        SELECT name, sql
+        FROM sqlite_master
+        WHERE type = 'index' AND tbl_name = 'transactions' AND sql IS NOT NULL
+        """
+    ).fetchall()
+    with conn:
+        for index in indexes:
+            conn.execute(f"DROP INDEX {index['name']}")
+    try:
+        yield
+    finally:
+        with conn:
+            for index in indexes:
+                conn.execute(index["sql"])
 
 
 def create_import_txn(
@@ -221,6 +431,7 @@ def create_import_txn(
                 import_batch_id,
             ),
         )
+    _invalidate_read_caches(db_path)
 
 
 def create_import_session(
@@ -666,6 +877,7 @@ def commit_import_session(db_path, *, session_id: str) -> dict:
         )
 
     assert summary is not None
+    _invalidate_read_caches(db_path)
     return {
         "imported_count": len(rows),
         "skipped_count": int(summary["skipped_count"]),
@@ -831,7 +1043,9 @@ def delete_bulk_by_filters(db_path, filters: dict) -> int:
             f"DELETE FROM transactions{where_sql}",
             tuple(params),
         )
-        return int(cur.rowcount)
+        deleted = int(cur.rowcount)
+    _invalidate_read_caches(db_path)
+    return deleted
 
 
 def delete_bulk_by_batch_ids(db_path, batch_ids: list[str]) -> int:
@@ -844,47 +1058,74 @@ def delete_txns_by_import_batch(db_path, batch_id: str) -> int:
             "DELETE FROM transactions WHERE import_batch_id = ?",
             (batch_id,),
         )
-        return int(cur.rowcount)
+        deleted = int(cur.rowcount)
+    _invalidate_read_caches(db_path)
+    return deleted
 
 
-def list_txns(db_path, *, account_id: int | None = None, start: str, end: str):
+def _txn_row_factory(cursor, row) -> Transaction:
+    return Transaction(*row)
+
+
+def _txn_rows(conn, start: str, end: str, limit: int | None = None):
+    # A dedicated cursor swaps sqlite3.Row (per-access column-name scans) for
+    # the slotted Transaction dataclass on this hot render path.
+    cur = conn.cursor()
+    cur.row_factory = _txn_row_factory
+    # SQLite treats LIMIT -1 as "no limit", which keeps this a single statement.
+    return cur.execute(
+        _SQL_SELECT_TXNS,
+        (start, end, -1 if limit is None else max(1, int(limit))),
+    ).fetchall()
+
+
+def list_txns(
+    db_path,
+    *,
+    account_id: int | None = None,
+    start: str,
+    end: str,
+    limit: int | None = None,
+):
     _ = account_id
     with connect(db_path) as conn:
-        cur = conn.execute(
-            """
-            SELECT * FROM transactions
-            WHERE date >= ? AND date <= ?
-            ORDER BY date DESC, id DESC
-            """,
-            (start, end),
-        )
-        return cur.fetchall()
+        return _txn_rows(conn, start, end, limit)
+
+
+def iter_export_rows(db_path, *, account_id: int | None = None, start: str, end: str):
+    """Yield CSV-ready rows lazily, with the amount already formatted in SQL.
+
+    Streaming responses resume this generator from whichever worker thread
+    the server has free, so it opens a private connection instead of
+    borrowing from the per-thread cache, and closes it when the caller is
+    done.
+    """
+    _ = account_id
+    path = str(db_path)
+    conn = sqlite3.connect(
+        path, check_same_thread=False, uri=path.startswith("file:")
+    )
+    try:
+        yield from conn.execute(_SQL_SELECT_EXPORT_ROWS, (start, end))
+    finally:
+        conn.close()
 
 
 def get_txn(db_path, txn_id: int, *, account_id: int | None = None):
     _ = account_id
     with connect(db_path) as conn:
-        return conn.execute(
-            """
-            SELECT * FROM transactions
-            WHERE id = ?
-            """,
-            (txn_id,),
-        ).fetchone()
+        return conn.execute(_SQL_SELECT_TXN, (txn_id,)).fetchone()
+
+
+def _category_names(conn) -> list[str]:
+    cur = conn.execute(_SQL_SELECT_CATEGORIES)
+    return [str(row["category"]) for row in cur.fetchall()]
 
 
 def list_categories(db_path, *, account_id: int = 1) -> list[str]:
     _ = account_id
     with connect(db_path) as conn:
-        cur = conn.execute(
-            """
-            SELECT DISTINCT category
-            FROM transactions
-            WHERE TRIM(category) <> ''
-            ORDER BY category ASC
-            """,
-        )
-        return [str(row["category"]) for row in cur.fetchall()]
+        return _category_names(conn)
 
 
 def update_txn(
@@ -901,17 +1142,7 @@ def update_txn(
     _ = account_id
     with connect(db_path) as conn:
         cur = conn.execute(
-            """
-            UPDATE transactions
-            SET
-              date = ?,
-              direction = ?,
-              amount_cents = ?,
-              category = ?,
-              note = ?,
-              updated_at = datetime('now')
-            WHERE id = ?
-            """,
+            _SQL_UPDATE_TXN,
             (
                 date_str,
                 direction,
@@ -921,7 +1152,9 @@ def update_txn(
                 txn_id,
             ),
         )
-        return int(cur.rowcount) > 0
+        updated = int(cur.rowcount) > 0
+    _invalidate_read_caches(db_path)
+    return updated
 
 
 def delete_txn(db_path, txn_id: int, *, account_id: int | None = None) -> None:
@@ -931,39 +1164,67 @@ def delete_txn(db_path, txn_id: int, *, account_id: int | None = None) -> None:
             "DELETE FROM transactions WHERE id = ?",
             (txn_id,),
         )
+    _invalidate_read_caches(db_path)
+
+
+def _summarize(conn, start: str, end: str) -> dict:
+    totals = {"income": 0, "expense": 0}
+    by_category = []
+    # The columns are consumed by position, so skip the sqlite3.Row wrapper
+    # and iterate plain tuples.
+    cur = conn.cursor()
+    cur.row_factory = None
+    for kind, name, amount_cents in cur.execute(_SQL_SUMMARY, (start, end)):
+        if kind == "total":
+            totals[name] = amount_cents
+        else:
+            by_category.append(CategoryTotal(name, amount_cents))
+
+    return {
+        "income_cents": totals["income"],
+        "expense_cents": totals["expense"],
+        "by_category": by_category,
+    }
 
 
 def get_summary(
     db_path, *, account_id: int | None = None, start: str, end: str
 ) -> dict:
     _ = account_id
+    cache_key = (str(db_path), start, end)
+    cached = _cache_get(_summary_cache, cache_key)
+    if cached is not None:
+        return cached
     with connect(db_path) as conn:
-        totals = conn.execute(
-            """
-            SELECT
-              COALESCE(SUM(CASE WHEN direction = 'income' THEN amount_cents END), 0) AS income_cents,
-              COALESCE(SUM(CASE WHEN direction = 'expense' THEN amount_cents END), 0) AS expense_cents
-            FROM transactions
-            WHERE date >= ? AND date <= ?
-            """,
-            (start, end),
-        ).fetchone()
-        by_category_rows = conn.execute(
-            """
-            SELECT category, SUM(amount_cents) AS amount_cents
-            FROM transactions
-            WHERE direction = 'expense' AND date >= ? AND date <= ?
-            GROUP BY category
-            ORDER BY amount_cents DESC, category ASC
-            """,
-            (start, end),
-        ).fetchall()
+        return _cache_put(_summary_cache, cache_key, _summarize(conn, start, end))
 
-    return {
-        "income_cents": int(totals["income_cents"]),
-        "expense_cents": int(totals["expense_cents"]),
-        "by_category": [
-            {"category": row["category"], "amount_cents": int(row["amount_cents"])}
-            for row in by_category_rows
-        ],
-    }
+
+def get_index_bundle(
+    db_path,
+    *,
+    account_id: int | None = None,
+    start: str,
+    end: str,
+    limit: int | None = None,
+    include_categories: bool = True,
+) -> dict:
+    """Fetch everything the index page renders over one connection.
+
+    Running the transaction list, category names, and summary back-to-back
+    on the same connection keeps the page cache warm and avoids three
+    separate statement/transaction scopes per render.
+    """
+    _ = account_id
+    cache_key = (str(db_path), start, end)
+    with connect(db_path) as conn:
+        # One deferred transaction so the page rows and the summary read the
+        # same snapshot instead of opening a read transaction per statement.
+        conn.execute("BEGIN")
+        summary = _cache_get(_summary_cache, cache_key)
+        if summary is None:
+            summary = _cache_put(_summary_cache, cache_key, _summarize(conn, start, end))
+        return {
+            "transactions": _txn_rows(conn, start, end, limit),
+            "categories": _category_names(conn) if include_categories else [],
+            "summary": summary,
+        }
@@ -1,17 +1,19 @@
+from urllib.parse import urlencode
+
 from fastapi import Request
 
 from ..i18n import TRANSLATIONS
 
 
 def _index_url(start: str, end: str, lang: str) -> str:
-    return f"/?start={start}&end={end}&lang={lang}"
+    return "/?" + urlencode({"start": start, "end": end, "lang": lang})
 
 
 def _review_url(lang: str, period: str | None = None) -> str:
-    base = f"/review?lang={lang}"
+    params = {"lang": lang}
     if period is not None:
-        return f"{base}&period={period}"
-    return base
+        params["period"] = period
+    return "/review?" + urlencode(params)
 
 
 def _import_url(
@@ -28,30 +30,28 @@ def _import_url(
     deleted: int | None = None,
     preview_token: str | None = None,
 ) -> str:
-    base = f"/import?start={start}&end={end}&lang={lang}"
-    if imported is not None:
-        base = f"{base}&imported={imported}"
     if skipped_status is None:
         skipped_status = skipped
-    if skipped_status is not None:
-        base = f"{base}&skipped_status={skipped_status}"
-    if skipped_non_cashflow is not None:
-        base = f"{base}&skipped_non_cashflow={skipped_non_cashflow}"
-    if skipped is not None:
-        base = f"{base}&skipped={skipped}"
-    if invalid is not None:
-        base = f"{base}&invalid={invalid}"
-    if batch_id is not None:
-        base = f"{base}&batch_id={batch_id}"
-    if deleted is not None:
-        base = f"{base}&deleted={deleted}"
-    if preview_token is not None:
-        base = f"{base}&preview_token={preview_token}"
-    return base
+    params: dict[str, object] = {"start": start, "end": end, "lang": lang}
+    optional = {
+        "imported": imported,
+        "skipped_status": skipped_status,
+        "skipped_non_cashflow": skipped_non_cashflow,
+        "skipped": skipped,
+        "invalid": invalid,
+        "batch_id": batch_id,
+        "deleted": deleted,
+        "preview_token": preview_token,
+    }
+    params.update(
+        {name: value for name, value in optional.items() if value is not None}
+    )
+    return "/import?" + urlencode(params)
 
 
 def _import_preview_url(session_id: str, *, start: str, end: str, lang: str) -> str:
-    return f"/import/preview/{session_id}?start={start}&end={end}&lang={lang}"
+    query = urlencode({"start": start, "end": end, "lang": lang})
+    return f"/import/preview/{session_id}?{query}"
 
 
 def _build_secondary_page_context(
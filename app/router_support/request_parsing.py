@@ -1,4 +1,5 @@
 from datetime import date as dt_date, timedelta
+from functools import lru_cache
 import re
 
 from fastapi import HTTPException
@@ -7,8 +8,9 @@ from fastapi import HTTPException
 _ISO_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
 
 
-def _current_month_range(today: dt_date | None = None) -> tuple[str, str]:
-    current = today or dt_date.today()
+@lru_cache(maxsize=4)
+def _month_range_for_ordinal(ordinal: int) -> tuple[str, str]:
+    current = dt_date.fromordinal(ordinal)
     month_start = dt_date(current.year, current.month, 1)
     if current.month == 12:
         next_month_start = dt_date(current.year + 1, 1, 1)
@@ -18,6 +20,11 @@ def _current_month_range(today: dt_date | None = None) -> tuple[str, str]:
     return month_start.isoformat(), month_end.isoformat()
 
 
+def _current_month_range(today: dt_date | None = None) -> tuple[str, str]:
+    current = today or dt_date.today()
+    return _month_range_for_ordinal(current.toordinal())
+
+
 def _validate_iso_date(value: str, *, field_name: str) -> str:
     if not _ISO_DATE_RE.fullmatch(value):
         raise HTTPException(status_code=400, detail=f"{field_name} must be YYYY-MM-DD")
@@ -1,18 +1,18 @@
 import csv
+from functools import lru_cache
 from io import StringIO
 
 from fastapi import APIRouter, Form, HTTPException, Request
-from fastapi.responses import HTMLResponse, RedirectResponse, Response
+from fastapi.responses import HTMLResponse, RedirectResponse, StreamingResponse
 
 from ..i18n import TRANSLATIONS, parse_lang
 from ..logic import parse_amount_to_cents, validate_direction
 from ..repo import (
     create_txn,
     delete_txn,
-    get_summary,
+    get_index_bundle,
     get_txn,
-    list_categories,
-    list_txns,
+    iter_export_rows,
     update_txn,
 )
 from ..router_support.navigation import _import_url, _index_url, _review_url
@@ -31,6 +31,14 @@ DEFAULT_CATEGORY_OPTIONS = [
     "shopping",
 ]
 DEFAULT_NOTE = "无"
+# Cap how many rows a single index render pulls out of SQLite; the summary
+# still covers the whole range.
+INDEX_PAGE_SIZE = 500
+
+
+@lru_cache(maxsize=None)
+def _compiled_template(name: str):
+    return templates.get_template(name)
 
 
 def _build_index_context(
@@ -42,11 +50,15 @@ def _build_index_context(
     lang: str,
 ) -> dict:
     _ = (account_id, show_archived)
-    transactions = list_txns(current_settings().db_path, start=start, end=end)
-    existing_categories = list_categories(current_settings().db_path)
+    bundle = get_index_bundle(
+        current_settings().db_path,
+        start=start,
+        end=end,
+        limit=INDEX_PAGE_SIZE,
+    )
     category_options: list[str] = []
     seen: set[str] = set()
-    for category in [*existing_categories, *DEFAULT_CATEGORY_OPTIONS]:
+    for category in [*bundle["categories"], *DEFAULT_CATEGORY_OPTIONS]:
         normalized = category.strip()
         if not normalized or normalized in seen:
             continue
@@ -54,8 +66,8 @@ def _build_index_context(
         category_options.append(normalized)
     return {
         "request": request,
-        "transactions": transactions,
-        "summary": get_summary(current_settings().db_path, start=start, end=end),
+        "transactions": bundle["transactions"],
+        "summary": bundle["summary"],
         "edit_txn_id": None,
         "start": start,
         "end": end,
@@ -76,6 +88,33 @@ def _build_index_context(
     }
 
 
+def _build_partial_context(
+    request: Request,
+    start: str,
+    end: str,
+    lang: str,
+) -> dict:
+    """Context for the summary + table partials, which never render the
+    category datalist or account chrome the full page needs."""
+    bundle = get_index_bundle(
+        current_settings().db_path,
+        start=start,
+        end=end,
+        limit=INDEX_PAGE_SIZE,
+        include_categories=False,
+    )
+    return {
+        "request": request,
+        "transactions": bundle["transactions"],
+        "summary": bundle["summary"],
+        "edit_txn_id": None,
+        "start": start,
+        "end": end,
+        "lang": lang,
+        "t": TRANSLATIONS[lang],
+    }
+
+
 def _render_partial(
     request: Request,
     start: str,
@@ -84,16 +123,10 @@ def _render_partial(
     show_archived: bool,
     lang: str,
 ) -> HTMLResponse:
-    context = _build_index_context(
-        request,
-        start,
-        end,
-        account_id,
-        show_archived,
-        lang,
-    )
-    summary_html = templates.get_template("_summary.html").render(**context)
-    table_html = templates.get_template("_transactions_table.html").render(**context)
+    _ = (account_id, show_archived)
+    context = _build_partial_context(request, start, end, lang)
+    summary_html = _compiled_template("_summary.html").render(**context)
+    table_html = _compiled_template("_transactions_table.html").render(**context)
     return HTMLResponse(summary_html + table_html)
 
 
@@ -130,16 +163,15 @@ def _transaction_template_context(
     end: str,
     lang: str,
 ) -> dict:
-    context = _build_index_context(
-        request,
-        start,
-        end,
-        1,
-        False,
-        lang,
-    )
-    context["txn"] = txn
-    return context
+    return {
+        "request": request,
+        "txn": txn,
+        "edit_txn_id": None,
+        "start": start,
+        "end": end,
+        "lang": lang,
+        "t": TRANSLATIONS[lang],
+    }
 
 
 @router.get("/", response_class=HTMLResponse)
@@ -239,7 +271,7 @@ def transaction_row(
         lang=resolved_lang,
     )
     return HTMLResponse(
-        templates.get_template("_transaction_display_row.html").render(**context)
+        _compiled_template("_transaction_display_row.html").render(**context)
     )
 
 
@@ -264,7 +296,7 @@ def edit_transaction_form(
         lang=resolved_lang,
     )
     return HTMLResponse(
-        templates.get_template("_transaction_edit_row.html").render(**context)
+        _compiled_template("_transaction_edit_row.html").render(**context)
     )
 
 
@@ -367,34 +399,29 @@ def export_csv(
     _ = show_archived
     resolved_start, resolved_end = _resolve_range(start, end)
     parse_lang(lang)
-    transactions = list_txns(
-        current_settings().db_path,
-        start=resolved_start,
-        end=resolved_end,
-    )
+    db_path = current_settings().db_path
 
-    output = StringIO()
-    writer = csv.writer(output)
-    writer.writerow(
-        ["id", "account_id", "date", "direction", "amount", "category", "note"]
-    )
-    for txn in transactions:
+    def generate_rows():
+        yield "\ufeff"
+        buffer = StringIO()
+        writer = csv.writer(buffer)
         writer.writerow(
-            [
-                txn["id"],
-                txn["account_id"],
-                txn["date"],
-                txn["direction"],
-                f"{txn['amount_cents'] / 100:.2f}",
-                txn["category"],
-                txn["note"],
-            ]
+            ["id", "account_id", "date", "direction", "amount", "category", "note"]
         )
+        # Flush in ~8KB chunks rather than per row; large exports otherwise
+        # pay one ASGI send per transaction.
+        for txn in iter_export_rows(db_path, start=resolved_start, end=resolved_end):
+            writer.writerow(tuple(txn))
+            if buffer.tell() >= 8192:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+        if buffer.tell():
+            yield buffer.getvalue()
 
-    body = "\ufeff" + output.getvalue()
     filename = f"ledger-{resolved_start}-to-{resolved_end}.csv"
-    return Response(
-        content=body,
+    return StreamingResponse(
+        generate_rows(),
         media_type="text/csv; charset=utf-8",
         headers={"Content-Disposition": f'attachment; filename=\"{filename}\"'},
     )
@@ -77,17 +77,17 @@ def _build_review_data(account_id: int, period: str, t: dict[str, str]) -> dict:
     current_bucket_set = set(current_buckets)
 
     for txn in txns:
-        txn_date = dt_date.fromisoformat(str(txn["date"]))
+        txn_date = dt_date.fromisoformat(txn.date)
         bucket = _review_bucket_start(txn_date, period)
-        amount_cents = int(txn["amount_cents"])
-        direction = str(txn["direction"])
+        amount_cents = txn.amount_cents
+        direction = txn.direction
 
         if bucket in current_bucket_set:
             if direction == "income":
                 current_income[bucket] += amount_cents
             elif direction == "expense":
                 current_expense[bucket] += amount_cents
-                category = str(txn["category"]).strip() or "uncategorized"
+                category = txn.category.strip() or "uncategorized"
                 current_categories[category] = (
                     current_categories.get(category, 0) + amount_cents
                 )
@@ -1,13 +1,15 @@
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Settings:
     data_dir: Path
     db_path: Path
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     data_dir = Path.cwd() / ".data"
     return Settings(data_dir=data_dir, db_path=data_dir / "ledger.sqlite")
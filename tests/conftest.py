@@ -0,0 +1,38 @@
+import shutil
+
+import pytest
+
+from app.db import close_connections, init_db
+from app.settings import Settings
+
+
+@pytest.fixture(scope="session")
+def schema_template(tmp_path_factory):
+    """Build the migrated schema once per session; tests copy the file."""
+    data_dir = tmp_path_factory.mktemp("schema-template")
+    settings = Settings(data_dir=data_dir, db_path=data_dir / "template.sqlite")
+    init_db(settings)
+    # Closing checkpoints the WAL so the template file is self-contained.
+    close_connections(settings.db_path)
+    return settings.db_path
+
+
+@pytest.fixture
+def fresh_db(schema_template, tmp_path):
+    """Settings backed by a private copy of the template database."""
+    db_path = tmp_path / "t.sqlite"
+    shutil.copyfile(schema_template, db_path)
+    return Settings(data_dir=tmp_path, db_path=db_path)
+
+
+@pytest.fixture
+def memory_db(tmp_path):
+    """Settings backed by an in-memory database; no disk I/O at all.
+
+    connect() caches one connection per (path, thread), so repo calls made
+    from the test thread all see the same ':memory:' database.
+    """
+    settings = Settings(data_dir=tmp_path, db_path=":memory:")
+    init_db(settings)
+    yield settings
+    close_connections(settings.db_path)
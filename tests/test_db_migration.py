@@ -1,6 +1,9 @@
 import sqlite3
+import threading
 
-from app.db import init_db
+import pytest
+
+from app.db import close_connections, connect, init_db
 from app.repo import get_summary, list_txns
 from app.settings import Settings
 
@@ -374,7 +377,7 @@ def test_single_ledger_reads_all_legacy_account_rows(tmp_path):
     init_db(settings)
 
     rows = list_txns(settings.db_path, start="2026-03-01", end="2026-03-31")
-    notes = [str(row["note"]) for row in rows]
+    notes = [row.note for row in rows]
     assert "default-row" in notes
     assert "family-row" in notes
 
@@ -553,3 +556,48 @@ def test_init_db_upgrades_direction_check_to_include_neutral(tmp_path):
     assert len(rows) == 1
     assert rows[0]["direction"] == "expense"
     conn2.close()
+
+
+def test_transaction_list_query_orders_by_index_without_sort(tmp_path):
+    settings = Settings(data_dir=tmp_path, db_path=tmp_path / "t.sqlite")
+    init_db(settings)
+
+    conn = sqlite3.connect(str(settings.db_path))
+    try:
+        plan_rows = conn.execute(
+            """
+            EXPLAIN QUERY PLAN
+            SELECT id, account_id, date, direction, amount_cents, category, note, import_batch_id
+            FROM transactions
+            WHERE date >= ? AND date <= ?
+            ORDER BY date DESC, id DESC
+            LIMIT ?
+            """,
+            ("2026-01-01", "2026-12-31", -1),
+        ).fetchall()
+    finally:
+        conn.close()
+
+    plan_text = " ".join(str(row[-1]) for row in plan_rows)
+    assert "idx_transactions_date_id" in plan_text
+    assert "TEMP B-TREE" not in plan_text
+
+
+def test_close_connections_closes_worker_thread_connections(tmp_path):
+    settings = Settings(data_dir=tmp_path, db_path=tmp_path / "t.sqlite")
+    init_db(settings)
+
+    opened = {}
+
+    def open_in_worker():
+        opened["conn"] = connect(settings.db_path)
+
+    worker = threading.Thread(target=open_in_worker)
+    worker.start()
+    worker.join()
+
+    # The sweep must close entries cached by other threads without raising.
+    close_connections(settings.db_path)
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        opened["conn"].execute("SELECT 1")
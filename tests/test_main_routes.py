@@ -253,8 +253,8 @@ def test_import_preview_edit_then_commit_persists_edited_category(client_and_set
 
     rows = list_txns(settings.db_path, start="2026-03-01", end="2026-03-31")
     assert len(rows) == 1
-    assert rows[0]["category"] == "food-fixed"
-    assert rows[0]["note"] == "edited-note"
+    assert rows[0].category == "food-fixed"
+    assert rows[0].note == "edited-note"
 
 
 def test_import_preview_bulk_delete_excludes_deleted_rows_on_commit(
@@ -517,8 +517,8 @@ def test_import_alipay_csv_imports_every_row_without_trade_no_dedup(
 
     rows = list_txns(settings.db_path, start="2026-03-01", end="2026-03-31")
     assert len(rows) == 4
-    assert [row["note"] for row in rows].count("午餐") == 2
-    assert [row["note"] for row in rows].count("退款到账") == 2
+    assert [row.note for row in rows].count("午餐") == 2
+    assert [row.note for row in rows].count("退款到账") == 2
 
 
 def test_import_alipay_csv_same_trade_no_rows_are_both_imported(client_and_settings):
@@ -545,7 +545,7 @@ def test_import_alipay_csv_same_trade_no_rows_are_both_imported(client_and_setti
 
     rows = list_txns(settings.db_path, start="2026-03-01", end="2026-03-31")
     assert len(rows) == 2
-    assert {row["note"] for row in rows} == {"午餐A", "午餐B"}
+    assert {row.note for row in rows} == {"午餐A", "午餐B"}
 
 
 def test_import_alipay_status_yi_shou_ru_is_importable(client_and_settings):
@@ -571,7 +571,7 @@ def test_import_alipay_status_yi_shou_ru_is_importable(client_and_settings):
 
     rows = list_txns(settings.db_path, start="2026-03-01", end="2026-03-31")
     assert len(rows) == 1
-    assert rows[0]["note"] == "收款"
+    assert rows[0].note == "收款"
 
 
 def test_import_alipay_status_jiao_yi_guan_bi_counted_as_skipped(client_and_settings):
@@ -635,7 +635,7 @@ def test_import_alipay_include_neutral_toggle_affects_skipped_non_cashflow(
         end="2026-03-31",
     )
     assert len(rows_after_include) == 2
-    assert {row["direction"] for row in rows_after_include} == {"expense", "neutral"}
+    assert {row.direction for row in rows_after_include} == {"expense", "neutral"}
 
     skip_response = client.post(
         "/import/alipay",
@@ -683,7 +683,7 @@ def test_import_alipay_csv_with_preface_header_and_tail_note_lines(client_and_se
 
     rows = list_txns(settings.db_path, start="2026-03-01", end="2026-03-31")
     assert len(rows) == 1
-    assert rows[0]["note"] == "早餐"
+    assert rows[0].note == "早餐"
 
 
 def test_import_alipay_csv_without_trade_no_still_imports(client_and_settings):
@@ -713,7 +713,7 @@ def test_import_alipay_csv_without_trade_no_still_imports(client_and_settings):
 
     rows = list_txns(settings.db_path, start="2026-03-01", end="2026-03-31")
     assert len(rows) == 1
-    assert rows[0]["note"] == "午餐"
+    assert rows[0].note == "午餐"
 
 
 def test_import_alipay_csv_supports_slash_date_format(client_and_settings):
@@ -735,7 +735,7 @@ def test_import_alipay_csv_supports_slash_date_format(client_and_settings):
 
     rows = list_txns(settings.db_path, start="2026-03-01", end="2026-03-31")
     assert len(rows) == 1
-    assert rows[0]["date"] == "2026-03-06"
+    assert rows[0].date == "2026-03-06"
 
 
 def test_import_alipay_generates_batch_id_and_rows_are_tagged(client_and_settings):
@@ -759,7 +759,7 @@ def test_import_alipay_generates_batch_id_and_rows_are_tagged(client_and_setting
 
     rows = list_txns(settings.db_path, start="2026-03-01", end="2026-03-31")
     assert len(rows) == 2
-    assert {row["import_batch_id"] for row in rows} == {batch_id}
+    assert {row.import_batch_id for row in rows} == {batch_id}
 
 
 def test_delete_import_batch_removes_only_target_batch(client_and_settings):
@@ -800,8 +800,8 @@ def test_delete_import_batch_removes_only_target_batch(client_and_settings):
 
     rows = list_txns(settings.db_path, start="2026-03-01", end="2026-03-31")
     assert len(rows) == 1
-    assert rows[0]["note"] == "keep-row"
-    assert rows[0]["import_batch_id"] is None
+    assert rows[0].note == "keep-row"
+    assert rows[0].import_batch_id is None
 
 
 def test_delete_import_batch_rejects_invalid_batch_id(client_and_settings):
@@ -908,7 +908,7 @@ def test_bulk_delete_preview_and_execute_for_selected_batches(client_and_setting
 
     rows = list_txns(settings.db_path, start="2026-03-01", end="2026-03-31")
     assert len(rows) == 1
-    assert rows[0]["import_batch_id"] == batch_two
+    assert rows[0].import_batch_id == batch_two
 
     result_page = client.get(execute.headers["location"])
     assert result_page.status_code == 200
@@ -973,7 +973,7 @@ def test_bulk_delete_by_conditions_only_removes_matching_rows(client_and_setting
     assert "deleted=1" in execute.headers["location"]
 
     rows = list_txns(settings.db_path, start="2026-03-01", end="2026-03-31")
-    notes = {row["note"] for row in rows}
+    notes = {row.note for row in rows}
     assert notes == {"keyword bus", "keyword refund"}
 
 
@@ -1143,8 +1143,8 @@ def test_create_transaction_success(client_and_settings):
 
     rows = list_txns(settings.db_path, start="2026-03-01", end="2026-03-31")
     assert len(rows) == 1
-    assert rows[0]["account_id"] == 1
-    assert rows[0]["note"] == "single ledger"
+    assert rows[0].account_id == 1
+    assert rows[0].note == "single ledger"
 
 
 def test_create_transaction_htmx_success(client_and_settings):
@@ -1159,7 +1159,7 @@ def test_create_transaction_htmx_success(client_and_settings):
 
     rows = list_txns(settings.db_path, start="2026-03-01", end="2026-03-31")
     assert len(rows) == 1
-    assert rows[0]["note"] == "htmx path"
+    assert rows[0].note == "htmx path"
 
 
 def test_delete_transaction_success(client_and_settings):
@@ -1245,12 +1245,12 @@ def test_update_transaction_htmx_success_refreshes_summary_and_table(client_and_
 
     rows = list_txns(settings.db_path, start="2026-03-01", end="2026-03-31")
     assert len(rows) == 1
-    assert rows[0]["id"] == txn_id
-    assert rows[0]["date"] == "2026-03-11"
-    assert rows[0]["direction"] == "income"
-    assert rows[0]["amount_cents"] == 8800
-    assert rows[0]["category"] == "salary"
-    assert rows[0]["note"] == "after update"
+    assert rows[0].id == txn_id
+    assert rows[0].date == "2026-03-11"
+    assert rows[0].direction == "income"
+    assert rows[0].amount_cents == 8800
+    assert rows[0].category == "salary"
+    assert rows[0].note == "after update"
 
 
 def test_update_transaction_rejects_invalid_date(client_and_settings):
@@ -1283,8 +1283,8 @@ def test_update_transaction_rejects_invalid_date(client_and_settings):
     assert response.json()["detail"] == "date must be YYYY-MM-DD"
 
     rows = list_txns(settings.db_path, start="2026-03-01", end="2026-03-31")
-    assert rows[0]["date"] == "2026-03-10"
-    assert rows[0]["note"] == "bad-edit-target"
+    assert rows[0].date == "2026-03-10"
+    assert rows[0].note == "bad-edit-target"
 
 
 def test_update_transaction_blank_note_defaults_to_wu(client_and_settings):
@@ -1317,7 +1317,7 @@ def test_update_transaction_blank_note_defaults_to_wu(client_and_settings):
     assert response.status_code == 303
 
     rows = list_txns(settings.db_path, start="2026-03-01", end="2026-03-31")
-    assert rows[0]["note"] == "无"
+    assert rows[0].note == "无"
 
 
 def test_create_transaction_rejects_invalid_date(client_and_settings):
@@ -1533,7 +1533,7 @@ def test_category_datalist_allows_suggest_and_custom_values(client_and_settings)
     )
     assert custom_response.status_code == 303
     rows = list_txns(settings.db_path, start="2026-03-01", end="2026-03-31")
-    assert any(row["category"] == "pet-care" for row in rows)
+    assert any(row.category == "pet-care" for row in rows)
 
 
 def test_note_empty_or_missing_defaults_to_wu(client_and_settings):
@@ -1556,7 +1556,7 @@ def test_note_empty_or_missing_defaults_to_wu(client_and_settings):
     assert missing_response.status_code == 303
 
     rows = list_txns(settings.db_path, start="2026-03-01", end="2026-03-31")
-    notes = [row["note"] for row in rows]
+    notes = [row.note for row in rows]
     assert notes.count("无") >= 2
 
 
@@ -1570,4 +1570,4 @@ def test_note_non_empty_is_trimmed(client_and_settings):
     assert response.status_code == 303
 
     rows = list_txns(settings.db_path, start="2026-03-01", end="2026-03-31")
-    assert rows[0]["note"] == "trimmed note"
+    assert rows[0].note == "trimmed note"
@@ -1,11 +1,19 @@
-from app.db import init_db
-from app.repo import create_txn, delete_txn, list_txns, update_txn
-from app.settings import Settings
+import sqlite3
+import threading
 
+from app.repo import (
+    create_txn,
+    create_txns_bulk,
+    delete_txn,
+    iter_export_rows,
+    list_txns,
+    update_txn,
+    with_deferred_indexes,
+)
 
-def test_create_list_delete(tmp_path):
-    settings = Settings(data_dir=tmp_path, db_path=tmp_path / "t.sqlite")
-    init_db(settings)
+
+def test_create_list_delete(fresh_db):
+    settings = fresh_db
 
     tid = create_txn(
         settings.db_path,
@@ -17,17 +25,16 @@ def test_create_list_delete(tmp_path):
     )
     rows = list_txns(settings.db_path, start="2026-02-01", end="2026-02-28")
     assert len(rows) == 1
-    assert rows[0]["id"] == tid
-    assert rows[0]["amount_cents"] == 1234
+    assert rows[0].id == tid
+    assert rows[0].amount_cents == 1234
 
     delete_txn(settings.db_path, tid)
     rows2 = list_txns(settings.db_path, start="2026-02-01", end="2026-02-28")
     assert rows2 == []
 
 
-def test_update_txn_updates_existing_row(tmp_path):
-    settings = Settings(data_dir=tmp_path, db_path=tmp_path / "t.sqlite")
-    init_db(settings)
+def test_update_txn_updates_existing_row(fresh_db):
+    settings = fresh_db
 
     tid = create_txn(
         settings.db_path,
@@ -54,10 +61,119 @@ def test_update_txn_updates_existing_row(tmp_path):
 
     rows = list_txns(settings.db_path, start="2026-02-01", end="2026-02-28")
     assert len(rows) == 1
-    assert rows[0]["id"] == tid
-    assert rows[0]["account_id"] == 1
-    assert rows[0]["date"] == "2026-02-26"
-    assert rows[0]["direction"] == "income"
-    assert rows[0]["amount_cents"] == 5678
-    assert rows[0]["category"] == "salary"
-    assert rows[0]["note"] == "after-edit"
+    assert rows[0].id == tid
+    assert rows[0].account_id == 1
+    assert rows[0].date == "2026-02-26"
+    assert rows[0].direction == "income"
+    assert rows[0].amount_cents == 5678
+    assert rows[0].category == "salary"
+    assert rows[0].note == "after-edit"
+
+
+def test_create_txns_bulk_inserts_all_rows(fresh_db):
+    settings = fresh_db
+
+    inserted = create_txns_bulk(
+        settings.db_path,
+        [
+            {
+                "date_str": "2026-02-25",
+                "direction": "expense",
+                "amount_cents": 1200,
+                "category": "food",
+                "note": "lunch",
+            },
+            {
+                "date_str": "2026-02-26",
+                "direction": "income",
+                "amount_cents": 500000,
+                "category": "salary",
+                "note": "monthly salary",
+            },
+        ],
+    )
+
+    assert inserted == 2
+    rows = list_txns(settings.db_path, start="2026-02-01", end="2026-02-28")
+    assert len(rows) == 2
+    assert all(row.account_id == 1 for row in rows)
+
+    assert create_txns_bulk(settings.db_path, []) == 0
+
+
+def test_with_deferred_indexes_rebuilds_after_bulk_load(fresh_db):
+    settings = fresh_db
+
+    def txn_index_names():
+        conn = sqlite3.connect(str(settings.db_path))
+        try:
+            rows = conn.execute(
+                """
+                SELECT name
+                FROM sqlite_master
+                WHERE type = 'index' AND tbl_name = 'transactions' AND sql IS NOT NULL
+                """
+            ).fetchall()
+        finally:
+            conn.close()
+        return {row[0] for row in rows}
+
+    names_before = txn_index_names()
+    assert names_before
+
+    with with_deferred_indexes(settings.db_path):
+        create_txns_bulk(
+            settings.db_path,
+            [
+                {
+                    "date_str": "2026-02-25",
+                    "direction": "expense",
+                    "amount_cents": 100 + i,
+                    "category": "bulk",
+                    "note": "row",
+                }
+                for i in range(10)
+            ],
+        )
+
+    assert txn_index_names() == names_before
+    rows = list_txns(settings.db_path, start="2026-02-01", end="2026-02-28")
+    assert len(rows) == 10
+
+
+def test_iter_export_rows_survives_thread_hops(fresh_db):
+    settings = fresh_db
+
+    create_txns_bulk(
+        settings.db_path,
+        [
+            {
+                "date_str": "2026-02-25",
+                "direction": "expense",
+                "amount_cents": 1200,
+                "category": "food",
+                "note": "lunch",
+            },
+            {
+                "date_str": "2026-02-26",
+                "direction": "income",
+                "amount_cents": 500000,
+                "category": "salary",
+                "note": "monthly salary",
+            },
+        ],
+    )
+
+    # StreamingResponse resumes the generator from varying worker threads;
+    # pulling the remaining rows from another thread must not raise.
+    gen = iter_export_rows(settings.db_path, start="2026-02-01", end="2026-02-28")
+    rows = [next(gen)]
+
+    def drain() -> None:
+        rows.extend(gen)
+
+    worker = threading.Thread(target=drain)
+    worker.start()
+    worker.join()
+
+    assert len(rows) == 2
@@ -1,58 +1,57 @@
-from app.db import init_db
-from app.repo import create_txn, get_summary
-from app.settings import Settings
+from app.repo import create_txns_bulk, get_summary
 
 
-def test_get_summary_totals_and_by_category(tmp_path):
-    settings = Settings(data_dir=tmp_path, db_path=tmp_path / "t.sqlite")
-    init_db(settings)
+# (date, direction, amount_cents, category, note)
+_FIXTURE_TXNS = (
+    ("2026-02-05", "income", 500000, "salary", "monthly salary"),
+    ("2026-02-06", "expense", 1200, "food", "lunch"),
+    ("2026-02-07", "expense", 800, "food", "snack"),
+    ("2026-02-08", "expense", 30000, "rent", "monthly rent"),
+)
 
-    create_txn(
-        settings.db_path,
-        date_str="2026-02-05",
-        direction="income",
-        amount_cents=500000,
-        category="salary",
-        note="monthly salary",
-    )
-    create_txn(
-        settings.db_path,
-        date_str="2026-02-06",
-        direction="expense",
-        amount_cents=1200,
-        category="food",
-        note="lunch",
-    )
-    create_txn(
-        settings.db_path,
-        date_str="2026-02-07",
-        direction="expense",
-        amount_cents=800,
-        category="food",
-        note="snack",
-    )
-    create_txn(
-        settings.db_path,
-        date_str="2026-02-08",
-        direction="expense",
-        amount_cents=30000,
-        category="rent",
-        note="monthly rent",
-    )
-    create_txn(
-        settings.db_path,
-        date_str="2026-03-01",
-        direction="expense",
-        amount_cents=999,
-        category="ignore",
-        note="outside range",
+
+def _seed_txns(db_path, txns) -> None:
+    create_txns_bulk(
+        db_path,
+        [
+            {
+                "date_str": date_str,
+                "direction": direction,
+                "amount_cents": amount_cents,
+                "category": category,
+                "note": note,
+            }
+            for date_str, direction, amount_cents, category, note in txns
+        ],
     )
 
+
+def test_get_summary_totals_and_by_category(memory_db):
+    settings = memory_db
+    _seed_txns(settings.db_path, _FIXTURE_TXNS)
+
     summary = get_summary(settings.db_path, start="2026-02-01", end="2026-02-28")
 
     assert summary["income_cents"] == 500000
     assert summary["expense_cents"] == 32000
     assert summary["by_category"] == [
-        {"category": "rent", "amount_cents": 30000},
-        {"category": "food", "amount_cents": 2000},
+        ("rent", 30000),
+        ("food", 2000),
     ]
+
+
+def test_get_summary_excludes_out_of_range_rows(memory_db):
+    settings = memory_db
+    _seed_txns(
+        settings.db_path,
+        (
+            ("2026-02-10", "expense", 1500, "food", "inside"),
+            ("2026-03-01", "expense", 999, "ignore", "outside range"),
+        ),
+    )
+
+    summary = get_summary(settings.db_path, start="2026-02-01", end="2026-02-28")
+
+    assert summary["income_cents"] == 0
+    assert summary["expense_cents"] == 1500
+    assert summary["by_category"] == [("food", 1500)]